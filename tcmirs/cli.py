@@ -17,6 +17,7 @@ from __future__ import annotations
 import argparse
 import xarray as xr
 
+from .config import IBTRACS_STORM_CHUNK
 from .ibtracs import get_storm_track
 from .mirs import find_mirs_files, load_and_merge_mirs
 from .output import build_output_dataset, write_output
@@ -56,6 +57,13 @@ def parse_args() -> argparse.Namespace:
         metavar="IDX",
         help="Only process these track row indices (e.g. --test-indices 42 43)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Worker processes for reading MIRS granule headers (default: serial)",
+    )
     parser.add_argument(
         "--filter-missing-wmo",
         action=argparse.BooleanOptionalAction,
@@ -88,6 +96,7 @@ def main() -> None:
         track=track,
         mirs_dir=args.mirs_dir,
         track_indices=args.test_indices,
+        max_workers=args.workers,
     )
     print(f"  IMG files: {len(img_files)}  SND files: {len(snd_files)}")
 
@@ -95,7 +104,9 @@ def main() -> None:
     ds_img, ds_snd = load_and_merge_mirs(img_files, snd_files, args.mirs_dir)
 
     print("Building output dataset...")
-    ds_ibt = xr.open_dataset(args.ibt_nc)
+    ds_ibt = xr.open_dataset(
+        args.ibt_nc, chunks={"storm": IBTRACS_STORM_CHUNK}, engine="netcdf4"
+    )
     ds_out = build_output_dataset(ds_img, ds_snd, ds_ibt, storm_name, args.year)
 
     write_output(ds_out, output_file)
@@ -33,4 +33,16 @@ IBTRACS_EXTRACT_VARS: list[str] = [
 ]
 
 #: Hours either side of each track point to search for matching MIRS granules
-TIME_WINDOW_HOURS: int = 12
\ No newline at end of file
+TIME_WINDOW_HOURS: int = 12
+
+#: Scanlines per dask chunk when lazily opening MIRS granules
+MIRS_SCANLINE_CHUNK: int = 1024
+
+#: Minimum candidate granules before ``find_mirs_files`` uses its process pool
+HEADER_SCAN_POOL_MIN_FILES: int = 64
+
+#: Storms per dask chunk when lazily opening the IBTrACS netCDF
+IBTRACS_STORM_CHUNK: int = 500
+
+#: Scanlines per on-disk chunk for multi-dimensional output variables
+OUTPUT_SCANLINE_CHUNK: int = 512
@@ -6,14 +6,83 @@ Functions for reading and filtering IBTrACS storm track data.
 
 from __future__ import annotations
 
+import csv
+import os
+import tempfile
+
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 
 from .config import IBTRACS_EXTRACT_VARS
 
 
-def _lon_to_360(dlon: float) -> float:
-    """Convert a longitude value from -180/180 to 0-360 degrees."""
-    return (360 + (dlon % 360)) % 360
+def _write_parquet_cache(table: pa.Table, parquet_path: str) -> bool:
+    """
+    Atomically write ``table`` to ``parquet_path``, returning ``False`` if the
+    cache cannot be written (e.g. the CSV sits in a read-only directory).
+
+    The table is written to a uniquely named temporary file first, so
+    concurrent runs never see or clobber each other's partial output.
+    """
+    try:
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(parquet_path) or ".",
+            prefix=os.path.basename(parquet_path) + ".",
+            suffix=".tmp",
+        )
+    except OSError:
+        return False
+    try:
+        with os.fdopen(fd, "wb") as f:
+            # Rows are roughly in time order, so modest row groups let the
+            # ISO_TIME filter skip most of the file using row-group statistics
+            pq.write_table(table, f, row_group_size=50_000)
+        os.replace(tmp_path, parquet_path)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return False
+    return True
+
+
+def _read_ibtracs_table(
+    ibtracs_csv: str,
+    columns: list[str],
+    filters: pc.Expression,
+) -> pa.Table:
+    """
+    Return the IBTrACS rows matching ``filters``, projected to ``columns``.
+
+    Reads come from a Parquet copy of the CSV that sits next to it with a
+    ``.parquet`` suffix, so the filters are pushed down into the read. The
+    copy is (re)built when missing or older than the CSV; if it cannot be
+    written, the freshly parsed CSV is filtered in memory instead. The units
+    row is skipped and every column is stored as a string, mirroring how the
+    CSV values are compared downstream.
+    """
+    parquet_path = os.path.splitext(ibtracs_csv)[0] + ".parquet"
+    if (
+        os.path.exists(parquet_path)
+        and os.path.getmtime(parquet_path) >= os.path.getmtime(ibtracs_csv)
+    ):
+        return pq.read_table(parquet_path, columns=columns, filters=filters)
+
+    with open(ibtracs_csv, newline="") as f:
+        header = next(csv.reader(f))
+
+    table = pacsv.read_csv(
+        ibtracs_csv,
+        read_options=pacsv.ReadOptions(skip_rows_after_names=1),
+        convert_options=pacsv.ConvertOptions(
+            column_types={c: pa.string() for c in header}
+        ),
+    )
+    _write_parquet_cache(table, parquet_path)
+    return table.filter(filters).select(columns)
 
 
 def get_storm_track(
@@ -26,6 +95,10 @@ def get_storm_track(
     """
     Load IBTrACS CSV data and return track rows for a named storm in a given year.
 
+    The CSV is converted to a cached Parquet copy on first use (see
+    :func:`_read_ibtracs_table`) so that the name and year filters are applied
+    while reading rather than after loading the whole archive.
+
     Parameters
     ----------
     name:
@@ -48,29 +121,29 @@ def get_storm_track(
         Filtered track data with an extra ``LON_180`` column (original
         longitude) and ``LON`` converted to 0-360 degrees.
     """
-    data = pd.read_csv(ibtracs_csv, low_memory=False)
-    data = data.iloc[1:, :]  # drop units row
-
-    year_start = pd.to_datetime(str(year))
-    year_end = pd.to_datetime(str(year + 1))
-
-    data = data[data["NAME"] == name]
-    data["ISO_TIME"] = pd.to_datetime(data["ISO_TIME"])
-
-    mask = (data["ISO_TIME"] >= year_start) & (data["ISO_TIME"] < year_end)
-    data = data[mask]
-
     vars_to_extract = IBTRACS_EXTRACT_VARS.copy()
     if extra_vars:
         vars_to_extract += [v for v in extra_vars if v not in vars_to_extract]
 
-    data = data[vars_to_extract]
+    # ISO_TIME is "YYYY-MM-DD HH:MM:SS", so string bounds select the calendar year
+    filters = (
+        (pc.field("NAME") == name)
+        & (pc.field("ISO_TIME") >= f"{year:04d}-01-01")
+        & (pc.field("ISO_TIME") < f"{year + 1:04d}-01-01")
+    )
+    table = _read_ibtracs_table(ibtracs_csv, vars_to_extract, filters)
+    data = table.to_pandas(types_mapper=pd.ArrowDtype)
 
     if filter_missing_wmo:
         data = data[data["WMO_WIND"] != " "]
         data = data[data["WMO_PRES"] != " "]
 
+    data["ISO_TIME"] = pd.to_datetime(
+        data["ISO_TIME"], format="%Y-%m-%d %H:%M:%S", errors="coerce"
+    )
+
     data["LON_180"] = data["LON"]
-    data["LON"] = data["LON"].astype(float).apply(_lon_to_360)
+    lon = pd.to_numeric(data["LON"], errors="coerce")
+    data["LON"] = np.mod(lon.to_numpy(dtype=np.float64, na_value=np.nan), 360.0)
 
     return data
\ No newline at end of file
@@ -8,54 +8,74 @@ overlap a tropical cyclone track in space and time.
 from __future__ import annotations
 
 import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
 
+import netCDF4
+import numpy as np
 import pandas as pd
-import pytz
+import shapely
 import xarray as xr
-from shapely import wkt
-from shapely.geometry import Point
+from shapely.geometry import Polygon
 
-from .config import TIME_WINDOW_HOURS, IMG_VARS_TO_REMOVE, SND_VARS_TO_KEEP
+from .config import (
+    TIME_WINDOW_HOURS,
+    IMG_VARS_TO_REMOVE,
+    SND_VARS_TO_KEEP,
+    MIRS_SCANLINE_CHUNK,
+    HEADER_SCAN_POOL_MIN_FILES,
+)
 
+#: MIRS filenames encode the scan window as ``_sYYYYMMDDhhmmssS_eYYYYMMDDhhmmssS_``
+_GRANULE_TIME_RE = re.compile(r"_s(\d{15})_e(\d{15})_")
 
-def _granule_overlaps_track_point(
-    ds: xr.Dataset,
-    lat: float,
-    lon_180: float,
-    t_behind: "pd.Timestamp",
-    t_ahead: "pd.Timestamp",
-    require_east_of_dateline: bool = True,
-) -> bool:
-    """
-    Return True if a MIRS granule's time window and spatial footprint
-    contain the given track point.
+#: Slack applied to filename times before the exact header check
+_FILENAME_TIME_SLACK = np.timedelta64(1, "m")
 
-    Parameters
-    ----------
-    ds:
-        Open MIRS xarray Dataset.
-    lat, lon_180:
-        Storm centre coordinates (longitude in -180/180 range).
-    t_behind, t_ahead:
-        UTC-aware timestamps defining the acceptable time window.
-    require_east_of_dateline:
-        If ``True`` (default), skip granules whose first FOV longitude is
-        >= 0, which filters out wrap-around granules for Atlantic storms.
-        Set to ``False`` for storms that cross the dateline.
+#: Global attributes read from each candidate granule
+_GRANULE_ATTRS = (
+    "time_coverage_start",
+    "time_coverage_end",
+    "geospatial_first_scanline_first_fov_lon",
+    "geospatial_bounds",
+)
+
+
+def _parse_granule_time(fname: str) -> tuple[np.datetime64, np.datetime64] | None:
+    """
+    Return the (naive UTC) scan start and end times encoded in a MIRS
+    filename, or ``None`` if the filename does not follow the MIRS convention.
     """
-    start = pd.to_datetime(ds.attrs["time_coverage_start"])
-    end = pd.to_datetime(ds.attrs["time_coverage_end"])
+    match = _GRANULE_TIME_RE.search(fname)
+    if match is None:
+        return None
+    start, end = (
+        np.datetime64(
+            f"{s[0:4]}-{s[4:6]}-{s[6:8]}T{s[8:10]}:{s[10:12]}:{s[12:14]}.{s[14]}",
+            "ns",
+        )
+        for s in match.groups()
+    )
+    return start, end
+
 
-    if not (t_behind <= start and t_ahead >= end):
-        return False
+def _read_granule_meta(path: str) -> dict[str, Any]:
+    """
+    Read only the global attributes needed for track matching from a MIRS
+    granule, without decoding any variables.
+    """
+    with netCDF4.Dataset(path, "r") as nc:
+        return {name: nc.getncattr(name) for name in _GRANULE_ATTRS}
 
-    if require_east_of_dateline:
-        if ds.attrs["geospatial_first_scanline_first_fov_lon"] >= 0:
-            return False
 
-    polygon_val = wkt.loads(ds.attrs["geospatial_bounds"])
-    point = Point(float(lon_180), float(lat))
-    return point.within(polygon_val)
+def _header_times(values: list[str]) -> np.ndarray:
+    """
+    Convert MIRS ``time_coverage_*`` attributes to a naive UTC
+    ``datetime64[ns]`` array in a single vectorized parse.
+    """
+    times = pd.to_datetime(values, utc=True, format="ISO8601")
+    return times.tz_localize(None).to_numpy("datetime64[ns]")
 
 
 def find_mirs_files(
@@ -64,6 +84,7 @@ def find_mirs_files(
     time_window_hours: int = TIME_WINDOW_HOURS,
     require_east_of_dateline: bool = True,
     track_indices: list[int] | None = None,
+    max_workers: int | None = None,
 ) -> tuple[list[str], list[str]]:
     """
     Identify MIRS IMG and SND granule files that overlap the storm track.
@@ -77,40 +98,110 @@ def find_mirs_files(
     time_window_hours:
         Hours either side of each track point to accept a granule.
     require_east_of_dateline:
-        Passed through to :func:`_granule_overlaps_track_point`.
+        If ``True`` (default), skip granules whose first FOV longitude is
+        >= 0, which filters out wrap-around granules for Atlantic storms.
+        Set to ``False`` for storms that cross the dateline.
     track_indices:
         If provided, only process these row indices of ``track``.
         Useful for testing without looping the full lifecycle.
+    max_workers:
+        If greater than 1, read candidate granule headers in a pool of this
+        many worker processes once there are at least
+        :data:`config.HEADER_SCAN_POOL_MIN_FILES` candidates. Defaults to
+        ``None``, which reads headers serially in-process. Below the
+        threshold the pool is skipped without notice, so passing
+        ``max_workers`` does not guarantee parallel reads. Scripts that
+        enable the pool must guard their entry point with
+        ``if __name__ == "__main__":`` on platforms that use the ``spawn``
+        start method (macOS, Windows).
 
     Returns
     -------
     tuple[list[str], list[str]]
         ``(img_files, snd_files)`` — sorted lists of matching filenames.
     """
-    mirs_files = os.listdir(mirs_dir)
-    indices = track_indices if track_indices is not None else range(len(track))
-    matched: set[str] = set()
-
-    for ipt in indices:
-        t_val = track["ISO_TIME"].iloc[ipt]
-        lat_val = track["LAT"].iloc[ipt]
-        lon_val = track["LON_180"].iloc[ipt]
-
-        print(f"  Checking track point {ipt}: {t_val}")
-
-        t_ahead = pytz.utc.localize(t_val + pd.to_timedelta(time_window_hours, unit="h"))
-        t_behind = pytz.utc.localize(t_val - pd.to_timedelta(time_window_hours, unit="h"))
-
-        for fname in mirs_files:
-            if not fname.endswith(".nc"):
-                continue
-            fpath = os.path.join(mirs_dir, fname)
-            ds = xr.open_dataset(fpath)
-            if _granule_overlaps_track_point(
-                ds, lat_val, lon_val, t_behind, t_ahead, require_east_of_dateline
-            ):
-                matched.add(fname)
-            ds.close()
+    timed: list[str] = []
+    untimed: list[str] = []
+    fn_times: list[tuple[np.datetime64, np.datetime64]] = []
+    for fname in sorted(os.listdir(mirs_dir)):
+        if not fname.endswith(".nc"):
+            continue
+        granule_time = _parse_granule_time(fname)
+        if granule_time is None:
+            untimed.append(fname)
+        else:
+            timed.append(fname)
+            fn_times.append(granule_time)
+    fn_start, fn_end = np.array(fn_times, dtype="datetime64[ns]").reshape(-1, 2).T
+
+    times = track["ISO_TIME"].to_numpy(dtype="datetime64[ns]")
+    lats = track["LAT"].to_numpy(dtype=np.float64)
+    lons180 = track["LON_180"].to_numpy(dtype=np.float64)
+
+    if track_indices is not None:
+        rows = np.asarray(track_indices, dtype=np.intp)
+        times, lats, lons180 = times[rows], lats[rows], lons180[rows]
+
+    window = np.timedelta64(time_window_hours, "h")
+    t_behind = times - window
+    t_ahead = times + window
+
+    n_granules = len(timed) + len(untimed)
+    print(f"  Checking {len(times)} track points against {n_granules} granules")
+
+    # Only granules whose filename times fall inside some window are opened
+    near = (
+        (fn_start[None, :] >= t_behind[:, None] - _FILENAME_TIME_SLACK)
+        & (fn_end[None, :] <= t_ahead[:, None] + _FILENAME_TIME_SLACK)
+    )
+    candidates = [fname for fname, keep in zip(timed, near.any(axis=0)) if keep]
+    candidates += untimed
+
+    candidate_fnames = sorted(candidates)
+    meta_cache: dict[str, dict[str, Any]] = {}
+    poly_cache: dict[str, Polygon] = {}
+    if candidate_fnames:
+        paths = [os.path.join(mirs_dir, fname) for fname in candidate_fnames]
+        # netCDF-C is not thread-safe, so a parallel scan uses processes
+        use_pool = (
+            max_workers is not None
+            and max_workers > 1
+            and len(paths) >= HEADER_SCAN_POOL_MIN_FILES
+        )
+        if use_pool:
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                metas = list(pool.map(_read_granule_meta, paths, chunksize=16))
+        else:
+            metas = [_read_granule_meta(path) for path in paths]
+        meta_cache = dict(zip(candidate_fnames, metas))
+        # Decode every footprint once, in a single vectorized call
+        bounds = [meta["geospatial_bounds"] for meta in meta_cache.values()]
+        poly_cache = dict(zip(meta_cache, shapely.from_wkt(bounds)))
+
+    granules = [
+        (fname, meta) for fname, meta in meta_cache.items()
+        if not (
+            require_east_of_dateline
+            and meta["geospatial_first_scanline_first_fov_lon"] >= 0
+        )
+    ]
+    fnames = [fname for fname, _ in granules]
+
+    g_start = _header_times([meta["time_coverage_start"] for _, meta in granules])
+    g_end = _header_times([meta["time_coverage_end"] for _, meta in granules])
+    in_window = (
+        (g_start[None, :] >= t_behind[:, None]) & (g_end[None, :] <= t_ahead[:, None])
+    )
+
+    # One spatial index over all footprints, queried with every track point
+    tree = shapely.STRtree([poly_cache[fname] for fname in fnames])
+    pt_idx, g_idx = tree.query(shapely.points(lons180, lats), predicate="within")
+
+    in_footprint = np.zeros_like(in_window)
+    in_footprint[pt_idx, g_idx] = True
+
+    granule_keep = (in_window & in_footprint).any(axis=0)
+    matched = [fnames[i] for i in np.nonzero(granule_keep)[0]]
 
     img_files = sorted(f for f in matched if f.startswith("NPR-MIRS-IMG"))
     snd_files = sorted(f for f in matched if f.startswith("NPR-MIRS-SND"))
@@ -125,7 +216,8 @@ def load_and_merge_mirs(
     img_vars_to_remove: list[str] = IMG_VARS_TO_REMOVE,
 ) -> tuple[xr.Dataset, xr.Dataset]:
     """
-    Load and concatenate MIRS IMG and SND granules, applying variable filters.
+    Lazily open and concatenate MIRS IMG and SND granules, applying variable
+    filters as each file is opened.
 
     Parameters
     ----------
@@ -141,7 +233,8 @@ def load_and_merge_mirs(
     Returns
     -------
     tuple[xr.Dataset, xr.Dataset]
-        ``(ds_img, ds_snd)`` merged datasets ready for output.
+        ``(ds_img, ds_snd)`` dask-backed merged datasets ready for output,
+        chunked along ``Scanline``.
 
     Raises
     ------
@@ -153,12 +246,24 @@ def load_and_merge_mirs(
     if not snd_files:
         raise ValueError("No MIRS SND files provided.")
 
-    ds_img_list = [xr.open_dataset(os.path.join(mirs_dir, f)) for f in img_files]
-    ds_img = xr.concat(ds_img_list, dim="Scanline").drop_vars(
-        img_vars_to_remove, errors="ignore"
+    ds_img = xr.open_mfdataset(
+        [os.path.join(mirs_dir, f) for f in img_files],
+        combine="nested",
+        concat_dim="Scanline",
+        engine="h5netcdf",
+        parallel=True,
+        chunks={"Scanline": MIRS_SCANLINE_CHUNK},
+        preprocess=lambda ds: ds.drop_vars(img_vars_to_remove, errors="ignore"),
     )
 
-    ds_snd_list = [xr.open_dataset(os.path.join(mirs_dir, f)) for f in snd_files]
-    ds_snd = xr.concat(ds_snd_list, dim="Scanline")[snd_vars_to_keep]
+    ds_snd = xr.open_mfdataset(
+        [os.path.join(mirs_dir, f) for f in snd_files],
+        combine="nested",
+        concat_dim="Scanline",
+        engine="h5netcdf",
+        parallel=True,
+        chunks={"Scanline": MIRS_SCANLINE_CHUNK},
+        preprocess=lambda ds: ds[snd_vars_to_keep],
+    )
 
     return ds_img, ds_snd
\ No newline at end of file
@@ -6,7 +6,72 @@ Functions for assembling the final merged dataset and writing to netCDF.
 
 from __future__ import annotations
 
+import functools
+
+import netCDF4
+import numpy as np
 import xarray as xr
+from dask.diagnostics import ProgressBar
+
+from .config import OUTPUT_SCANLINE_CHUNK
+
+
+@functools.lru_cache(maxsize=None)
+def _zstd_available() -> bool:
+    """Return True if the netCDF-C build can write zstd-compressed variables."""
+    if not getattr(netCDF4, "__has_zstandard_support__", False):
+        return False
+    with netCDF4.Dataset("zstd_probe.nc", "w", diskless=True) as nc:
+        return bool(nc.has_zstd_filter())
+
+
+def _chunks_for(var: xr.Variable) -> tuple[int, ...]:
+    """
+    Return on-disk chunk sizes for a variable: ``OUTPUT_SCANLINE_CHUNK``
+    scanlines by the full extent of every other dimension.
+    """
+    return tuple(
+        min(size, OUTPUT_SCANLINE_CHUNK) if dim == "Scanline" else size
+        for dim, size in zip(var.dims, var.shape)
+    )
+
+
+#: CF packing keys carried over from each variable's source encoding
+_PACKING_ENCODING_KEYS = frozenset({
+    "dtype", "_FillValue", "scale_factor", "add_offset", "units", "calendar",
+    "_Unsigned",
+})
+
+
+def _compression_encoding(ds: xr.Dataset) -> dict[str, dict]:
+    """
+    Build a compression encoding for every data variable that netCDF4 can
+    compress, using zstd when available and zlib otherwise. Variables with a
+    ``Scanline`` dimension are also given Scanline-tiled chunks. Variable-length
+    string variables are left at their default encoding.
+
+    The CF packing keys of each variable's existing encoding (``dtype``,
+    ``scale_factor``, ``add_offset``, ``_FillValue``, ...) are kept so packed
+    fields stay packed; everything else from the source is discarded.
+    """
+    if _zstd_available():
+        base = {"compression": "zstd", "complevel": 3}
+    else:
+        base = {"zlib": True, "complevel": 4, "shuffle": True}
+
+    encoding = {}
+    for name, var in ds.data_vars.items():
+        if var.dtype.kind in "OU":
+            continue
+        encoding[name] = {
+            key: value for key, value in var.encoding.items()
+            if key in _PACKING_ENCODING_KEYS
+        }
+        encoding[name].update(base)
+        # Byte strings gain a char dimension on disk, so skip their chunking
+        if "Scanline" in var.dims and var.dtype.kind != "S" and all(var.shape):
+            encoding[name]["chunksizes"] = _chunks_for(var.variable)
+    return encoding
 
 
 def build_output_dataset(
@@ -38,24 +103,34 @@ def build_output_dataset(
         Merged dataset with TC metadata attributes attached.
     """
     storm_name_bytes = bytes(storm_name, "UTF-8")
-    ds_storm = ds_ibt.where(ds_ibt.name == storm_name_bytes, drop=True)
-    ds_storm = ds_storm.where(ds_storm.season == float(storm_year), drop=True)
+    mask = (ds_ibt["name"].values == storm_name_bytes) & (
+        ds_ibt["season"].values == float(storm_year)
+    )
+    ds_storm = ds_ibt.isel(storm=np.flatnonzero(mask))
+
+    # The storm shares no dimensions with the MIRS data, so attach it directly
+    ds_merged = xr.merge([ds_img, ds_snd])
+    ds_merged = ds_merged.assign_coords(ds_storm.coords).assign(ds_storm.data_vars)
 
-    ds_merged = xr.merge([ds_img, ds_snd, ds_storm])
+    # Load the few fields used for attributes in one pass
+    stats = ds_storm[["iso_time", "lat", "lon"]].load()
+    lat = stats["lat"].values
+    lon = stats["lon"].values
 
     ds_merged.attrs["TC_name"] = storm_name
-    ds_merged.attrs["TC_time_start"] = bytes.decode(ds_storm["iso_time"][:, 0].item())
-    ds_merged.attrs["TC_minimum_lat"] = round(float(ds_storm["lat"].min()), 2)
-    ds_merged.attrs["TC_minimum_lon"] = round(float(ds_storm["lon"].min()), 2)
-    ds_merged.attrs["TC_maximum_lat"] = round(float(ds_storm["lat"].max()), 2)
-    ds_merged.attrs["TC_maximum_lon"] = round(float(ds_storm["lon"].max()), 2)
+    ds_merged.attrs["TC_time_start"] = bytes.decode(stats["iso_time"][:, 0].item())
+    ds_merged.attrs["TC_minimum_lat"] = round(float(np.nanmin(lat)), 2)
+    ds_merged.attrs["TC_minimum_lon"] = round(float(np.nanmin(lon)), 2)
+    ds_merged.attrs["TC_maximum_lat"] = round(float(np.nanmax(lat)), 2)
+    ds_merged.attrs["TC_maximum_lon"] = round(float(np.nanmax(lon)), 2)
 
     return ds_merged
 
 
 def write_output(ds: xr.Dataset, output_path: str) -> None:
     """
-    Write a dataset to a netCDF file.
+    Write a dataset to a compressed netCDF file, streaming dask-backed
+    variables chunk by chunk rather than loading them into memory.
 
     Parameters
     ----------
@@ -64,5 +139,9 @@ def write_output(ds: xr.Dataset, output_path: str) -> None:
     output_path:
         Full path for the output ``.nc`` file.
     """
-    ds.to_netcdf(output_path)
+    delayed = ds.to_netcdf(
+        output_path, encoding=_compression_encoding(ds), compute=False
+    )
+    with ProgressBar():
+        delayed.compute()
     print(f"Output written to: {output_path}")
\ No newline at end of file